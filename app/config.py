@@ -8,6 +8,7 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     openai_api_key: str = Field(..., alias="OPENAI_API_KEY")
     openai_model_name: str = Field("gpt-4o", alias="OPENAI_MODEL_NAME")
+    critic_model_name: str = Field("gpt-4o-mini", alias="CRITIC_MODEL_NAME")
     openai_embedding_model: str = Field(
         "text-embedding-3-small", alias="OPENAI_EMBEDDING_MODEL"
     )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import threading
+from typing import Final, Literal
 
 from langgraph.graph import END, StateGraph
 
@@ -16,10 +17,13 @@ from app.nodes import (
 from app.state import AgentState
 
 # Budget threshold for forced summarization
-BUDGET_THRESHOLD = 500
+BUDGET_THRESHOLD: Final[int] = 500
 
 # Quality threshold for completion
-QUALITY_THRESHOLD = 0.85
+QUALITY_THRESHOLD: Final[float] = 0.85
+
+# Consecutive no-improvement loops tolerated before bailing out
+MAX_STAGNANT_LOOPS: Final[int] = 2
 
 
 def should_continue(state: AgentState) -> Literal["end", "loop", "summarize"]:
@@ -30,32 +34,31 @@ def should_continue(state: AgentState) -> Literal["end", "loop", "summarize"]:
     - Remaining token budget
     - Quality score from critic
     - Step count vs max steps
+    - Quality stagnation across consecutive loops
 
     Returns:
         "end": Quality threshold met, finalize with draft answer
         "summarize": Budget depleted or max steps reached, compress and exit
         "loop": Retry planning for better result
     """
-    remaining = state.get("remaining_tokens", 0)
-    quality = state.get("quality_score", 0.0)
-    step_count = state.get("step_count", 0)
-    max_steps = state.get("max_steps", 5)
-    status = state.get("status", "")
-
-    # Check for insufficient budget errors from nodes
-    if status.startswith("INSUFFICIENT_BUDGET"):
-        return "summarize"
+    # Most common termination first: quality threshold met - we're done
+    if state.quality_score >= QUALITY_THRESHOLD:
+        return "end"
 
     # Budget exhausted - force summarization
-    if remaining <= BUDGET_THRESHOLD:
+    if state.remaining_tokens <= BUDGET_THRESHOLD:
         return "summarize"
 
-    # Quality threshold met - we're done
-    if quality >= QUALITY_THRESHOLD:
-        return "end"
-
     # Max steps reached - summarize what we have
-    if step_count >= max_steps:
+    if state.step_count >= state.max_steps:
+        return "summarize"
+
+    # Insufficient budget errors reported by nodes
+    if state.status.startswith("INSUFFICIENT_BUDGET"):
+        return "summarize"
+
+    # Quality has stalled - further loops would just burn budget
+    if state.no_progress_count >= MAX_STAGNANT_LOOPS:
         return "summarize"
 
     # Otherwise, loop back and try again
@@ -67,8 +70,8 @@ def finalize_node(state: AgentState) -> AgentState:
     Finalization node - promotes draft to final answer.
     Called when quality threshold is met.
     """
-    state["final_answer"] = state.get("draft_answer", "")
-    state["status"] = "COMPLETED"
+    state.final_answer = state.draft_answer
+    state.status = "COMPLETED"
     return state
 
 
@@ -86,7 +89,9 @@ def build_graph() -> StateGraph:
     """
     graph = StateGraph(AgentState)
 
-    # Add all nodes
+    # Add all nodes. Planner and critic memoize their LLM calls
+    # internally (see their modules) so retry loops skip the request
+    # while token accounting and control fields stay live.
     graph.add_node("planner", planner_node)
     graph.add_node("retriever", retriever_node)
     graph.add_node("generator", generator_node)
@@ -129,13 +134,20 @@ def compile_graph():
     return graph.compile()
 
 
-# Singleton compiled graph instance
+# Singleton compiled graph instance. Kept lazy (rather than compiled at
+# import) so importing app.graph stays cheap; the FastAPI lifespan
+# handler warms it before serving.
 _COMPILED_GRAPH = None
+_COMPILE_LOCK = threading.Lock()
 
 
 def get_compiled_graph():
-    """Get or create the compiled graph singleton."""
+    """Get or create the compiled graph singleton (thread-safe)."""
     global _COMPILED_GRAPH
     if _COMPILED_GRAPH is None:
-        _COMPILED_GRAPH = compile_graph()
+        # Double-checked locking: without it, concurrent first callers
+        # race the read-then-write and can each compile the graph
+        with _COMPILE_LOCK:
+            if _COMPILED_GRAPH is None:
+                _COMPILED_GRAPH = compile_graph()
     return _COMPILED_GRAPH
@@ -0,0 +1,44 @@
+"""Tiny TTL cache for memoizing node LLM results.
+
+Memoization lives inside the nodes, keyed on the exact inputs of each
+LLM call, rather than at the graph layer: LangGraph node caching
+replays a node's cached *writes*, and the nodes here return the whole
+mutated state, so a graph-level cache hit would also replay stale token
+accounting and control-flow fields.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """Small thread-safe mapping with per-entry expiry."""
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._entries: Dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # Opportunistically drop expired entries so the cache can't
+            # grow without bound
+            expired = [k for k, (exp, _) in self._entries.items() if exp < now]
+            for k in expired:
+                del self._entries[k]
+            self._entries[key] = (now + self._ttl, value)
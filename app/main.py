@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.config import get_settings
 from app.graph import get_compiled_graph
+from app.nodes import planner_node, retriever_node
+from app.nodes.generator import stream_draft_answer
+from app.rag.async_batch import run_batch_poller, submit_embedding_batch
 from app.rag.vector_store import get_vector_store
 from app.state import initialize_state
+from app.token_accounting import _get_encoder
 
 # =============================================================================
 # Request/Response Models
@@ -51,6 +59,11 @@ class DocumentsRequest(BaseModel):
     metadatas: Optional[List[Dict]] = Field(
         None, description="Optional metadata for each chunk"
     )
+    async_batch: bool = Field(
+        False,
+        description="Embed via the OpenAI Batch API (cheaper, completes "
+        "within 24h) instead of inline",
+    )
 
 
 class DocumentsResponse(BaseModel):
@@ -58,6 +71,9 @@ class DocumentsResponse(BaseModel):
 
     message: str = Field(..., description="Status message")
     count: int = Field(..., description="Number of documents ingested")
+    batch_id: Optional[str] = Field(
+        None, description="OpenAI batch id when async_batch was requested"
+    )
 
 
 class HealthResponse(BaseModel):
@@ -72,10 +88,27 @@ class HealthResponse(BaseModel):
 # =============================================================================
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the lazily-initialized singletons at startup so the first
+    /query request doesn't pay for tiktoken encoder construction,
+    Chroma client/collection setup, or graph compilation.
+    """
+    _get_encoder(get_settings().openai_model_name)
+    get_vector_store()
+    get_compiled_graph()
+    poller = asyncio.create_task(run_batch_poller())
+    yield
+    poller.cancel()
+
+
 app = FastAPI(
     title="Token-Gated LLM API",
     description="LLM execution with budget enforcement using LangGraph",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -112,10 +145,10 @@ async def query(request: QueryRequest):
         max_steps=max_steps,
     )
 
-    # Execute the graph
+    # Execute the graph without blocking the event loop
     try:
         graph = get_compiled_graph()
-        final_state = graph.invoke(initial_state)
+        final_state = await graph.ainvoke(initial_state)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Execution error: {str(e)}")
 
@@ -123,7 +156,7 @@ async def query(request: QueryRequest):
     answer = final_state.get("final_answer") or final_state.get("draft_answer") or ""
     status = final_state.get("status", "UNKNOWN")
     tokens_used = final_state.get("tokens_used", {})
-    total_tokens = sum(tokens_used.values())
+    total_tokens = final_state.get("total_consumed", 0)
     steps_executed = final_state.get("step_count", 0)
 
     return QueryResponse(
@@ -135,20 +168,90 @@ async def query(request: QueryRequest):
     )
 
 
+@app.post("/query/stream")
+async def query_stream(request: QueryRequest):
+    """
+    Streaming variant of /query using server-sent events.
+
+    Runs the planner and retriever, then streams the generator's tokens
+    as they arrive, so time-to-first-token is the model's first-token
+    latency rather than the full graph runtime. The critic/retry loop is
+    skipped on this path; a terminal `usage` event carries the status
+    and token accounting.
+    """
+    settings = get_settings()
+
+    token_budget = request.token_budget or settings.default_token_budget
+    max_steps = request.max_steps or settings.default_max_steps
+
+    state = initialize_state(
+        user_query=request.query,
+        total_token_budget=token_budget,
+        max_steps=max_steps,
+    )
+
+    async def event_stream() -> AsyncIterator[str]:
+        # The 200 header is already sent once streaming starts, so
+        # failures can't become an HTTP 500 like /query's. Report them
+        # as an SSE error event and still close with a usage event.
+        status = "COMPLETED"
+        try:
+            await planner_node(state)
+            if not state.status.startswith("INSUFFICIENT_BUDGET"):
+                await retriever_node(state)
+                async for delta in stream_draft_answer(state):
+                    payload = orjson.dumps({"delta": delta}).decode()
+                    yield f"data: {payload}\n\n"
+            if state.status.startswith("INSUFFICIENT_BUDGET"):
+                status = state.status
+        except Exception as e:
+            status = "ERROR"
+            detail = orjson.dumps({"detail": f"Execution error: {str(e)}"}).decode()
+            yield f"event: error\ndata: {detail}\n\n"
+
+        summary = {
+            "status": status,
+            "tokens_used": state.tokens_used,
+            "total_tokens": state.total_consumed,
+        }
+        yield f"event: usage\ndata: {orjson.dumps(summary).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/documents", response_model=DocumentsResponse)
-async def ingest_documents(request: DocumentsRequest):
+async def ingest_documents(request: DocumentsRequest, response: Response):
     """
     Ingest documents into the vector store.
 
     Documents are embedded using OpenAI embeddings and stored in ChromaDB
-    for later retrieval during query execution.
+    for later retrieval during query execution. With async_batch=true the
+    embedding work is offloaded to the OpenAI Batch API (50% cheaper,
+    higher rate limits) and a background poller ingests the results when
+    the job completes.
     """
     if not request.texts:
         raise HTTPException(status_code=400, detail="No texts provided")
 
+    if request.async_batch:
+        try:
+            batch_id = await submit_embedding_batch(
+                texts=request.texts,
+                metadatas=request.metadatas,
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Batch submit error: {str(e)}")
+
+        response.status_code = status.HTTP_202_ACCEPTED
+        return DocumentsResponse(
+            message="Batch embedding job submitted",
+            count=len(request.texts),
+            batch_id=batch_id,
+        )
+
     try:
         vector_store = get_vector_store()
-        vector_store.add_texts(
+        await vector_store.aadd_texts(
             texts=request.texts,
             metadatas=request.metadatas,
         )
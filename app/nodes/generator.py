@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from openai import OpenAI
+from functools import lru_cache
+from typing import AsyncIterator
 
 from app.config import get_settings
+from app.openai_client import get_async_openai_client
 from app.state import AgentState
 from app.token_accounting import consume_tokens, estimate_tokens
 
@@ -15,24 +17,21 @@ Use the context to give accurate, well-structured answers.
 If the context doesn't contain relevant information, say so clearly.
 Be concise but thorough."""
 
+# Prebuilt system message; rebuilding the dict per call is pure waste
+_SYSTEM_MSG = {"role": "system", "content": GENERATOR_SYSTEM_PROMPT}
 
-def generator_node(state: AgentState) -> AgentState:
-    """
-    Generate an answer using retrieved context.
 
-    Budget requirement: 2500 tokens.
-    If budget is insufficient, sets status and returns early.
-    """
-    if state.get("remaining_tokens", 0) < GENERATOR_REQUIRED_BUDGET:
-        state["status"] = "INSUFFICIENT_BUDGET_FOR_GENERATION"
-        return state
+@lru_cache(maxsize=1)
+def _system_prompt_tokens() -> int:
+    # The system prompt is constant; tokenize it once for the fallback path
+    return estimate_tokens(GENERATOR_SYSTEM_PROMPT)
 
-    settings = get_settings()
-    client = OpenAI(api_key=settings.openai_api_key)
 
-    user_query = state.get("user_query", "")
-    chunks = state.get("retrieved_chunks", [])
-    plan = state.get("plan", "")
+def _build_user_message(state: AgentState) -> str:
+    """Assemble the generator prompt from plan, context, and query."""
+    user_query = state.user_query
+    chunks = state.retrieved_chunks
+    plan = state.plan
 
     # Build context from retrieved chunks
     if chunks:
@@ -41,7 +40,7 @@ def generator_node(state: AgentState) -> AgentState:
     else:
         context_section = "No context was retrieved. Answer based on general knowledge."
 
-    user_message = f"""## Plan
+    return f"""## Plan
 {plan}
 
 {context_section}
@@ -51,10 +50,27 @@ def generator_node(state: AgentState) -> AgentState:
 
 Please provide a comprehensive answer based on the above context and plan."""
 
-    response = client.chat.completions.create(
+
+async def generator_node(state: AgentState) -> AgentState:
+    """
+    Generate an answer using retrieved context.
+
+    Budget requirement: 2500 tokens.
+    If budget is insufficient, sets status and returns early.
+    """
+    if state.remaining_tokens < GENERATOR_REQUIRED_BUDGET:
+        state.status = "INSUFFICIENT_BUDGET_FOR_GENERATION"
+        return state
+
+    settings = get_settings()
+    client = get_async_openai_client()
+
+    user_message = _build_user_message(state)
+
+    response = await client.chat.completions.create(
         model=settings.openai_model_name,
         messages=[
-            {"role": "system", "content": GENERATOR_SYSTEM_PROMPT},
+            _SYSTEM_MSG,
             {"role": "user", "content": user_message},
         ],
         max_tokens=1000,
@@ -62,17 +78,75 @@ Please provide a comprehensive answer based on the above context and plan."""
     )
 
     answer_text = response.choices[0].message.content or ""
-    state["draft_answer"] = answer_text
+    state.draft_answer = answer_text
 
     # Calculate actual token usage
     usage = response.usage
     if usage:
         total_tokens = usage.prompt_tokens + usage.completion_tokens
     else:
-        total_tokens = estimate_tokens(
-            GENERATOR_SYSTEM_PROMPT + user_message + answer_text
+        total_tokens = (
+            _system_prompt_tokens()
+            + estimate_tokens(user_message)
+            + estimate_tokens(answer_text)
         )
 
     state = consume_tokens(state, "generator", total_tokens)
 
     return state
+
+
+async def stream_draft_answer(state: AgentState) -> AsyncIterator[str]:
+    """
+    Streaming variant of generator_node.
+
+    Yields answer text deltas as they arrive so callers can forward them
+    to the client immediately. When the stream ends, the state is
+    updated in place with the full draft and token accounting, using the
+    usage block OpenAI appends when include_usage is requested.
+    """
+    if state.remaining_tokens < GENERATOR_REQUIRED_BUDGET:
+        state.status = "INSUFFICIENT_BUDGET_FOR_GENERATION"
+        return
+
+    settings = get_settings()
+    client = get_async_openai_client()
+
+    user_message = _build_user_message(state)
+
+    stream = await client.chat.completions.create(
+        model=settings.openai_model_name,
+        messages=[
+            _SYSTEM_MSG,
+            {"role": "user", "content": user_message},
+        ],
+        max_tokens=1000,
+        temperature=0.5,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+
+    parts: list[str] = []
+    usage = None
+    async for chunk in stream:
+        if chunk.usage:
+            usage = chunk.usage
+        if chunk.choices and chunk.choices[0].delta.content:
+            delta = chunk.choices[0].delta.content
+            parts.append(delta)
+            yield delta
+
+    answer_text = "".join(parts)
+    state.draft_answer = answer_text
+
+    # Calculate actual token usage
+    if usage:
+        total_tokens = usage.prompt_tokens + usage.completion_tokens
+    else:
+        total_tokens = (
+            _system_prompt_tokens()
+            + estimate_tokens(user_message)
+            + estimate_tokens(answer_text)
+        )
+
+    consume_tokens(state, "generator", total_tokens)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from openai import OpenAI
+from functools import lru_cache
 
 from app.config import get_settings
+from app.llm_cache import TTLCache
+from app.openai_client import get_async_openai_client
 from app.state import AgentState
 from app.token_accounting import consume_tokens, estimate_tokens
 
@@ -14,27 +16,48 @@ PLANNER_SYSTEM_PROMPT = """You are a concise planning assistant.
 Given a user query, produce a brief execution plan (2-4 steps) for answering it.
 Keep your plan under 150 words. Be direct and actionable."""
 
+# Prebuilt system message; rebuilding the dict per call is pure waste
+_SYSTEM_MSG = {"role": "system", "content": PLANNER_SYSTEM_PROMPT}
 
-def planner_node(state: AgentState) -> AgentState:
+# Plans for recently seen queries. On critic-driven retries (and repeat
+# requests) the query is unchanged, so re-planning would spend ~800
+# tokens on an essentially identical plan. Only the LLM output is
+# memoized; token accounting and control fields stay live.
+_PLAN_CACHE = TTLCache(ttl=300.0)
+
+
+@lru_cache(maxsize=1)
+def _system_prompt_tokens() -> int:
+    # The system prompt is constant; tokenize it once for the fallback path
+    return estimate_tokens(PLANNER_SYSTEM_PROMPT)
+
+
+async def planner_node(state: AgentState) -> AgentState:
     """
     Generate an execution plan for the user query.
 
     Budget requirement: 800 tokens.
     If budget is insufficient, sets status and returns early.
     """
-    if state.get("remaining_tokens", 0) < PLANNER_REQUIRED_BUDGET:
-        state["status"] = "INSUFFICIENT_BUDGET_FOR_PLANNING"
+    if state.remaining_tokens < PLANNER_REQUIRED_BUDGET:
+        state.status = "INSUFFICIENT_BUDGET_FOR_PLANNING"
         return state
 
-    settings = get_settings()
-    client = OpenAI(api_key=settings.openai_api_key)
+    user_query = state.user_query
+
+    cached_plan = _PLAN_CACHE.get(user_query)
+    if cached_plan is not None:
+        state.plan = cached_plan
+        state.step_count += 1
+        return state
 
-    user_query = state.get("user_query", "")
+    settings = get_settings()
+    client = get_async_openai_client()
 
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model=settings.openai_model_name,
         messages=[
-            {"role": "system", "content": PLANNER_SYSTEM_PROMPT},
+            _SYSTEM_MSG,
             {"role": "user", "content": f"Create a plan to answer: {user_query}"},
         ],
         max_tokens=300,
@@ -42,16 +65,21 @@ def planner_node(state: AgentState) -> AgentState:
     )
 
     plan_text = response.choices[0].message.content or ""
-    state["plan"] = plan_text
+    state.plan = plan_text
+    _PLAN_CACHE.set(user_query, plan_text)
 
     # Calculate actual token usage from response
     usage = response.usage
     if usage:
         total_tokens = usage.prompt_tokens + usage.completion_tokens
     else:
-        total_tokens = estimate_tokens(PLANNER_SYSTEM_PROMPT + user_query + plan_text)
+        total_tokens = (
+            _system_prompt_tokens()
+            + estimate_tokens(user_query)
+            + estimate_tokens(plan_text)
+        )
 
     state = consume_tokens(state, "planner", total_tokens)
-    state["step_count"] = state.get("step_count", 0) + 1
+    state.step_count += 1
 
     return state
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from app.rag.vector_store import get_vector_store
+from app.rag.query_batcher import get_query_batcher
 from app.state import AgentState
-from app.token_accounting import consume_tokens, estimate_tokens
+from app.token_accounting import consume_tokens, estimate_tokens_many
 
 # Reserve this much budget for the generator
 MIN_GENERATION_BUDGET = 3000
@@ -13,19 +13,28 @@ MIN_GENERATION_BUDGET = 3000
 TOKENS_PER_CHUNK = 400
 
 
-def retriever_node(state: AgentState) -> AgentState:
+async def retriever_node(state: AgentState) -> AgentState:
     """
     Retrieve relevant chunks from the vector store.
 
     Dynamically adjusts top_k based on remaining budget after reserving
     capacity for generation. This prevents RAG cost explosions.
+
+    On critic-driven retry loops the query hasn't changed, so existing
+    chunks are reused instead of re-querying (and re-billing the chunk
+    token estimate).
     """
-    remaining = state.get("remaining_tokens", 0)
+    user_query = state.user_query
+
+    if state.retrieved_chunks and state.last_retrieval_query == user_query:
+        return state
+
+    remaining = state.remaining_tokens
     available_for_context = remaining - MIN_GENERATION_BUDGET
 
     if available_for_context <= 0:
         # No budget for retrieval; proceed with empty context
-        state["retrieved_chunks"] = []
+        state.retrieved_chunks = []
         return state
 
     # Compute how many chunks we can afford
@@ -33,16 +42,20 @@ def retriever_node(state: AgentState) -> AgentState:
     # Cap at reasonable maximum
     top_k = min(top_k, 10)
 
-    user_query = state.get("user_query", "")
-
-    vector_store = get_vector_store()
-    chunks = vector_store.similarity_search(query=user_query, k=top_k)
+    # The batcher coalesces concurrent searches into one Chroma call and
+    # keeps the blocking work off the event loop. Reuse the query's
+    # embedding across loop iterations so retries don't re-embed.
+    result = await get_query_batcher().search(
+        user_query, k=top_k, query_embedding=state.query_embedding or None
+    )
+    state.query_embedding = result.query_embedding
+    chunks = result.chunks
 
-    state["retrieved_chunks"] = chunks
+    state.retrieved_chunks = chunks
+    state.last_retrieval_query = user_query
 
-    # Estimate token cost of retrieved chunks
-    chunk_text = "\n\n".join(chunks)
-    estimated_cost = estimate_tokens(chunk_text) if chunks else 0
+    # Estimate token cost of retrieved chunks (batched tokenization)
+    estimated_cost = sum(estimate_tokens_many(chunks)) if chunks else 0
 
     state = consume_tokens(state, "retriever", estimated_cost)
 
@@ -0,0 +1,33 @@
+"""Shared OpenAI client factories.
+
+Clients are cached as process-wide singletons (mirroring the
+``get_settings`` pattern in ``app/config.py``) so each node call reuses
+the same httpx connection pool instead of paying for a fresh client and
+TLS handshake.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> "OpenAI":
+    # Deferred: the openai SDK is a heavy import and the lru_cache means
+    # the cost is paid at most once, on first use
+    from openai import OpenAI
+
+    return OpenAI(api_key=get_settings().openai_api_key)
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> "AsyncOpenAI":
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=get_settings().openai_api_key)
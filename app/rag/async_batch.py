@@ -0,0 +1,194 @@
+"""OpenAI Batch API offramp for bulk document ingestion.
+
+Large ingests can opt out of the synchronous embedding path: the texts
+are uploaded as a Batch API embeddings job (half the sync-API price,
+separate rate limits), the batch id and original texts are persisted in
+a small SQLite table, and a background poller writes the results into
+Chroma once the job completes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from app.config import get_settings
+from app.openai_client import get_async_openai_client
+
+logger = logging.getLogger(__name__)
+
+# How often the background task checks pending jobs (seconds)
+POLL_INTERVAL_SECONDS = 60
+
+# Batch statuses that will never complete
+_TERMINAL_FAILURES = {"failed", "expired", "cancelled"}
+
+
+def _db_path() -> Path:
+    # Lives alongside the Chroma persist dir so state stays in one place
+    persist_dir = Path(get_settings().chroma_persist_dir)
+    persist_dir.mkdir(parents=True, exist_ok=True)
+    return persist_dir / "embedding_batches.sqlite3"
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(_db_path())
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_batches (
+            batch_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            texts TEXT NOT NULL,
+            metadatas TEXT
+        )
+        """
+    )
+    return conn
+
+
+def _record_batch(
+    batch_id: str, texts: Sequence[str], metadatas: Sequence[dict] | None
+) -> None:
+    with _connect() as conn:
+        conn.execute(
+            "INSERT INTO embedding_batches (batch_id, status, texts, metadatas)"
+            " VALUES (?, 'pending', ?, ?)",
+            (
+                batch_id,
+                json.dumps(list(texts)),
+                json.dumps(list(metadatas) if metadatas is not None else None),
+            ),
+        )
+
+
+def _pending_batches() -> List[tuple]:
+    with _connect() as conn:
+        return conn.execute(
+            "SELECT batch_id, texts, metadatas FROM embedding_batches"
+            " WHERE status = 'pending'"
+        ).fetchall()
+
+
+def _mark_batch(batch_id: str, status: str) -> None:
+    with _connect() as conn:
+        conn.execute(
+            "UPDATE embedding_batches SET status = ? WHERE batch_id = ?",
+            (status, batch_id),
+        )
+
+
+async def submit_embedding_batch(
+    texts: Sequence[str], metadatas: Sequence[dict] | None = None
+) -> str:
+    """
+    Upload texts as a Batch API embeddings job and record it for the
+    poller. Returns the OpenAI batch id.
+    """
+    settings = get_settings()
+    client = get_async_openai_client()
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"text-{i}",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {
+                    "input": text,
+                    "model": settings.openai_embedding_model,
+                },
+            }
+        )
+        for i, text in enumerate(texts)
+    ]
+    payload = "\n".join(lines).encode("utf-8")
+
+    input_file = await client.files.create(
+        file=("embeddings.jsonl", payload), purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h",
+    )
+
+    await asyncio.to_thread(_record_batch, batch.id, texts, metadatas)
+    return batch.id
+
+
+async def poll_pending_batches() -> None:
+    """Check pending jobs once; ingest any that completed into Chroma."""
+    rows = await asyncio.to_thread(_pending_batches)
+    if not rows:
+        return
+
+    client = get_async_openai_client()
+    for batch_id, texts_json, metadatas_json in rows:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            await _ingest_completed(
+                batch, json.loads(texts_json), json.loads(metadatas_json)
+            )
+            await asyncio.to_thread(_mark_batch, batch_id, "ingested")
+        elif batch.status in _TERMINAL_FAILURES:
+            logger.warning("Embedding batch %s ended as %s", batch_id, batch.status)
+            await asyncio.to_thread(_mark_batch, batch_id, batch.status)
+
+
+async def _ingest_completed(
+    batch, texts: List[str], metadatas: List[dict] | None
+) -> None:
+    from app.rag.vector_store import get_vector_store
+
+    client = get_async_openai_client()
+    content = await client.files.content(batch.output_file_id)
+
+    embeddings_by_id: Dict[str, List[float]] = {}
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        body = response["body"]
+        embeddings_by_id[record["custom_id"]] = body["data"][0]["embedding"]
+
+    # Preserve input order; drop texts whose individual request failed
+    kept_texts: List[str] = []
+    kept_embeddings: List[List[float]] = []
+    kept_metadatas: List[dict] = []
+    for i, text in enumerate(texts):
+        embedding = embeddings_by_id.get(f"text-{i}")
+        if embedding is None:
+            logger.warning("Batch %s: no embedding for text %d, skipping", batch.id, i)
+            continue
+        kept_texts.append(text)
+        kept_embeddings.append(embedding)
+        if metadatas is not None:
+            kept_metadatas.append(metadatas[i])
+
+    if not kept_texts:
+        return
+
+    store = get_vector_store()
+    await asyncio.to_thread(
+        store.add_embedded_texts,
+        kept_texts,
+        kept_embeddings,
+        kept_metadatas if metadatas is not None else None,
+    )
+
+
+async def run_batch_poller(interval: float = POLL_INTERVAL_SECONDS) -> None:
+    """Background loop for the FastAPI lifespan: poll until cancelled."""
+    while True:
+        try:
+            await poll_pending_batches()
+        except Exception:
+            logger.exception("Embedding batch poll failed")
+        await asyncio.sleep(interval)
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from typing import List
-
-from langchain_openai import OpenAIEmbeddings
+import asyncio
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List
 
 from app.config import get_settings
+from app.token_accounting import estimate_tokens_many
+
+if TYPE_CHECKING:
+    from langchain_openai import OpenAIEmbeddings
+
+# OpenAI rejects embedding requests above ~300k tokens; stay safely under
+MAX_BATCH_TOKENS = 250_000
+
 
+@lru_cache(maxsize=1)
+def get_embedding_model() -> "OpenAIEmbeddings":
+    # Cached: rebuilding the wrapper per call recreates the underlying
+    # OpenAI client and its httpx pool; the instance is thread-safe.
+    # Deferred import: langchain_openai pulls in the full langchain stack
+    from langchain_openai import OpenAIEmbeddings
 
-def get_embedding_model() -> OpenAIEmbeddings:
     settings = get_settings()
     return OpenAIEmbeddings(
         api_key=settings.openai_api_key,
@@ -15,11 +28,47 @@ def get_embedding_model() -> OpenAIEmbeddings:
     )
 
 
+def batched(
+    texts: List[str], max_tokens: int = MAX_BATCH_TOKENS
+) -> Iterator[List[str]]:
+    """
+    Greedily pack texts into sub-batches under the API token ceiling.
+
+    A single oversized text still goes out as its own batch; the API
+    rejects it either way, and splitting a chunk here would corrupt it.
+    """
+    batch: List[str] = []
+    batch_tokens = 0
+    for text, tokens in zip(texts, estimate_tokens_many(texts)):
+        if batch and batch_tokens + tokens > max_tokens:
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
 def embed_texts(texts: List[str]) -> List[List[float]]:
     if not texts:
         return []
     model = get_embedding_model()
-    return model.embed_documents(texts)
+    embeddings: List[List[float]] = []
+    for sub in batched(texts):
+        embeddings.extend(model.embed_documents(sub))
+    return embeddings
+
+
+async def aembed_texts(texts: List[str]) -> List[List[float]]:
+    """Async variant that embeds all sub-batches concurrently."""
+    if not texts:
+        return []
+    model = get_embedding_model()
+    results = await asyncio.gather(
+        *(model.aembed_documents(sub) for sub in batched(texts))
+    )
+    return [embedding for sub_result in results for embedding in sub_result]
 
 
 def embed_query(text: str) -> List[float]:
@@ -0,0 +1,141 @@
+"""Micro-batching layer for concurrent similarity searches.
+
+Queries arriving within a short window are coalesced into a single
+multi-vector Chroma call (one embedding request and one HNSW traversal
+pass per batch instead of per request).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List, NamedTuple
+
+from app.rag.embeddings import embed_texts
+from app.rag.vector_store import ChromaVectorStore, get_vector_store
+
+# Coalesce at most this many queries per Chroma call
+MAX_BATCH_SIZE = 16
+
+# How long the first query in a batch waits for company (seconds)
+MAX_WAIT_SECONDS = 0.05
+
+
+class SearchResult(NamedTuple):
+    """Chunks for one query plus the embedding that produced them.
+
+    The embedding is returned so callers can cache and reuse it
+    (retry loops re-query the same text)."""
+
+    chunks: List[str]
+    query_embedding: List[float]
+
+
+class _PendingQuery:
+    __slots__ = ("query", "k", "embedding", "future")
+
+    def __init__(
+        self,
+        query: str,
+        k: int,
+        embedding: List[float] | None,
+        future: "asyncio.Future[List[str]]",
+    ):
+        self.query = query
+        self.k = k
+        self.embedding = embedding
+        self.future = future
+
+
+class QueryBatcher:
+    """
+    Coalesces concurrent ``similarity_search`` calls into batched
+    vector-store queries. Producers await a future; a single consumer
+    task drains the queue, issues one batched call, and resolves each
+    future with its slice of the results.
+    """
+
+    def __init__(
+        self,
+        vector_store: ChromaVectorStore | None = None,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait: float = MAX_WAIT_SECONDS,
+    ) -> None:
+        self._vector_store = vector_store
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._queue: "asyncio.Queue[_PendingQuery]" = asyncio.Queue()
+        self._consumer: asyncio.Task | None = None
+
+    async def search(
+        self,
+        query: str,
+        k: int = 4,
+        query_embedding: List[float] | None = None,
+    ) -> SearchResult:
+        if not query and not query_embedding:
+            return SearchResult(chunks=[], query_embedding=[])
+        future: "asyncio.Future[List[str]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        item = _PendingQuery(query, k, query_embedding, future)
+        await self._queue.put(item)
+        self._ensure_consumer()
+        chunks = await future
+        return SearchResult(chunks=chunks, query_embedding=item.embedding or [])
+
+    def _ensure_consumer(self) -> None:
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[_PendingQuery]) -> None:
+        try:
+            results = await asyncio.to_thread(self._search_batch, batch)
+        except Exception as exc:  # propagate to every waiter, don't die
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            return
+        for item, docs in zip(batch, results):
+            if not item.future.done():
+                item.future.set_result(docs)
+
+    def _search_batch(self, batch: List[_PendingQuery]) -> List[List[str]]:
+        store = self._vector_store or get_vector_store()
+        # Embed only the queries that arrived without a precomputed
+        # embedding, all in one call
+        missing = [item for item in batch if item.embedding is None]
+        if missing:
+            computed = embed_texts([item.query for item in missing])
+            for item, embedding in zip(missing, computed):
+                item.embedding = embedding
+        return store.similarity_search_batch(
+            ks=[item.k for item in batch],
+            query_embeddings=[item.embedding for item in batch],
+        )
+
+
+_QUERY_BATCHER: QueryBatcher | None = None
+
+
+def get_query_batcher() -> QueryBatcher:
+    global _QUERY_BATCHER
+    if _QUERY_BATCHER is None:
+        _QUERY_BATCHER = QueryBatcher()
+    return _QUERY_BATCHER
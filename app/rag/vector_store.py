@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import uuid
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
-import chromadb
-from chromadb.config import Settings as ChromaSettings
-
 from app.config import get_settings
-from app.rag.embeddings import embed_query, embed_texts
+from app.rag.embeddings import aembed_texts, embed_query, embed_texts
 
 
 class ChromaVectorStore:
@@ -16,6 +16,11 @@ class ChromaVectorStore:
     """
 
     def __init__(self, collection_name: str = "documents") -> None:
+        # Deferred: chromadb takes hundreds of ms to import, so only pay
+        # for it when a store is actually constructed
+        import chromadb
+        from chromadb.config import Settings as ChromaSettings
+
         settings = get_settings()
         persist_dir = Path(settings.chroma_persist_dir)
         persist_dir.mkdir(parents=True, exist_ok=True)
@@ -28,6 +33,10 @@ class ChromaVectorStore:
             )
         )
         self._collection = self._client.get_or_create_collection(name=collection_name)
+        # Seed the ID counter once; count() is a DB round-trip we don't
+        # want to repeat on every add
+        self._next_id = self._collection.count()
+        self._id_lock = threading.Lock()
 
     def add_texts(
         self, texts: Sequence[str], metadatas: Sequence[dict] | None = None
@@ -35,20 +44,92 @@ class ChromaVectorStore:
         if not texts:
             return
         embeddings = embed_texts(list(texts))
-        ids = [f"doc-{self._collection.count()}-{i}" for i in range(len(texts))]
+        self._store(texts, embeddings, metadatas)
+
+    async def aadd_texts(
+        self, texts: Sequence[str], metadatas: Sequence[dict] | None = None
+    ) -> None:
+        """Async ingestion path: embedding sub-batches run concurrently."""
+        if not texts:
+            return
+        embeddings = await aembed_texts(list(texts))
+        await asyncio.to_thread(self._store, texts, embeddings, metadatas)
+
+    def add_embedded_texts(
+        self,
+        texts: Sequence[str],
+        embeddings: List[List[float]],
+        metadatas: Sequence[dict] | None = None,
+    ) -> None:
+        """Ingest texts whose embeddings were computed elsewhere
+        (e.g. an OpenAI Batch API job)."""
+        if not texts:
+            return
+        self._store(texts, embeddings, metadatas)
+
+    def _store(
+        self,
+        texts: Sequence[str],
+        embeddings: List[List[float]],
+        metadatas: Sequence[dict] | None,
+    ) -> None:
+        with self._id_lock:
+            base = self._next_id
+            self._next_id += len(texts)
+        # uuid suffix guards against collisions if two processes share
+        # the same persist directory
+        ids = [
+            f"doc-{base}-{i}-{uuid.uuid4().hex[:8]}" for i in range(len(texts))
+        ]
         self._collection.add(
             ids=ids,
             documents=list(texts),
             embeddings=embeddings,
             metadatas=list(metadatas) if metadatas is not None else None,
         )
-        # persist
-        self._client.persist()
 
-    def similarity_search(self, query: str, k: int = 4) -> List[str]:
-        if not query:
+    def similarity_search_batch(
+        self,
+        queries: List[str] | None = None,
+        ks: Sequence[int] | None = None,
+        *,
+        query_embeddings: List[List[float]] | None = None,
+    ) -> List[List[str]]:
+        """
+        Run many similarity searches as one multi-vector Chroma query.
+        Accepts either raw queries (embedded in one call) or precomputed
+        embeddings. Results are returned per query, trimmed to each
+        query's requested k (default 4 when ks is omitted).
+        """
+        if query_embeddings is None:
+            if not queries:
+                return []
+            query_embeddings = embed_texts(queries)
+        if not query_embeddings:
             return []
-        query_embedding = embed_query(query)
+        if not ks:
+            ks = [4] * len(query_embeddings)
+        max_k = max(ks)
+        results = self._collection.query(
+            query_embeddings=query_embeddings,
+            n_results=max_k,
+        )
+        docs_per_query = results.get("documents") or [[] for _ in query_embeddings]
+        return [list(docs[:k]) for docs, k in zip(docs_per_query, ks)]
+
+    def similarity_search(
+        self,
+        query: str | None = None,
+        *,
+        query_embedding: List[float] | None = None,
+        k: int = 4,
+    ) -> List[str]:
+        # A caller that already holds the query's embedding (e.g. a loop
+        # retry) can pass it and skip the embedding round-trip
+        if query_embedding is None:
+            if not query:
+                return []
+            query_embedding = embed_query(query)
         if not query_embedding:
             return []
         results = self._collection.query(
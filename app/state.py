@@ -1,30 +1,42 @@
-from typing import Dict, List, TypedDict
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 
-class AgentState(TypedDict, total=False):
+@dataclass(slots=True)
+class AgentState:
     """
     Core agent state for token-gated LangGraph execution.
+
+    A slotted dataclass rather than a TypedDict: field reads in the hot
+    node paths are C-level slot fetches instead of dict lookups with
+    default construction, and LangGraph accepts dataclass state schemas
+    directly.
     """
 
     # Input
-    user_query: str
+    user_query: str = ""
 
     # Artifacts
-    plan: str
-    retrieved_chunks: List[str]
-    draft_answer: str
-    final_answer: str
+    plan: str = ""
+    query_embedding: List[float] = field(default_factory=list)
+    retrieved_chunks: List[str] = field(default_factory=list)
+    last_retrieval_query: str = ""
+    draft_answer: str = ""
+    final_answer: str = ""
 
     # Token gating
-    total_token_budget: int
-    remaining_tokens: int
-    tokens_used: Dict[str, int]
+    total_token_budget: int = 0
+    remaining_tokens: int = 0
+    tokens_used: Dict[str, int] = field(default_factory=dict)
+    total_consumed: int = 0
 
     # Control
-    step_count: int
-    max_steps: int
-    quality_score: float
-    status: str
+    step_count: int = 0
+    max_steps: int = 5
+    quality_score: float = 0.0
+    prev_quality_score: float = 0.0
+    no_progress_count: int = 0
+    status: str = "INIT"
 
 
 def initialize_state(
@@ -37,15 +49,7 @@ def initialize_state(
     """
     return AgentState(
         user_query=user_query,
-        plan="",
-        retrieved_chunks=[],
-        draft_answer="",
-        final_answer="",
         total_token_budget=total_token_budget,
         remaining_tokens=total_token_budget,
-        tokens_used={},
-        step_count=0,
         max_steps=max_steps,
-        quality_score=0.0,
-        status="INIT",
     )
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from typing import Dict
-
-import tiktoken
+import os
+from typing import TYPE_CHECKING, Dict, List
 
 from .config import get_settings
 from .state import AgentState
 
-_ENCODERS: Dict[str, tiktoken.Encoding] = {}
+if TYPE_CHECKING:
+    import tiktoken
+
+_ENCODERS: Dict[str, "tiktoken.Encoding"] = {}
 
 
-def _get_encoder(model: str) -> tiktoken.Encoding:
+def _get_encoder(model: str) -> "tiktoken.Encoding":
     if model not in _ENCODERS:
+        # Deferred: tiktoken costs ~150ms to import and isn't needed
+        # until the first estimate, so keep it off the startup path
+        import tiktoken
+
         _ENCODERS[model] = tiktoken.encoding_for_model(model)
     return _ENCODERS[model]
 
@@ -29,6 +35,23 @@ def estimate_tokens(text: str, model: str | None = None) -> int:
     return len(encoder.encode(text))
 
 
+def estimate_tokens_many(texts: List[str], model: str | None = None) -> List[int]:
+    """
+    Token estimates for a batch of texts in one call.
+
+    encode_ordinary_batch runs the Rust-backed BPE tokenizer across
+    threads (releasing the GIL), so batching beats per-text encode calls
+    for ingestion and multi-chunk estimates.
+    """
+    if not texts:
+        return []
+    settings = get_settings()
+    model_name = model or settings.openai_model_name
+    encoder = _get_encoder(model_name)
+    encoded = encoder.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+    return [len(tokens) for tokens in encoded]
+
+
 def consume_tokens(
     state: AgentState,
     node_name: str,
@@ -37,15 +60,15 @@ def consume_tokens(
     """
     Centralized token accounting.
 
-    Mutates and returns the same state dict for convenience.
+    Mutates and returns the same state object for convenience.
     """
-    remaining = state.get("remaining_tokens", 0)
-    remaining -= max(0, estimated_tokens)
-    state["remaining_tokens"] = max(remaining, 0)
-
-    tokens_used = state.get("tokens_used") or {}
-    prev = tokens_used.get(node_name, 0)
-    tokens_used[node_name] = prev + max(0, estimated_tokens)
-    state["tokens_used"] = tokens_used
+    spent = max(0, estimated_tokens)
+    state.remaining_tokens = max(state.remaining_tokens - spent, 0)
+
+    prev = state.tokens_used.get(node_name, 0)
+    state.tokens_used[node_name] = prev + spent
+
+    # Running total so readers don't have to re-sum the per-node dict
+    state.total_consumed += spent
 
     return state